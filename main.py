@@ -7,17 +7,10 @@ and user data through the Medium API.
 
 Note: Publication-related functionality has been removed.
 
+Requires the package to be installed (`pip install -e .` or `uv sync`).
 Run with: mcp dev main.py
 """
 
-import sys
-from pathlib import Path
-
-# Add src directory to Python path so we can import medium_mcp
-src_path = Path(__file__).parent / "src"
-if src_path.exists():
-    sys.path.insert(0, str(src_path))
-
 from medium_mcp.server import mcp
 
 if __name__ == "__main__":
@@ -1,9 +1,22 @@
 """Medium MCP Server - Fetch Medium data via MCP protocol."""
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Marcus"
 __email__ = "marcuslin912@gmail.com"
 
-from .server import mcp
+if TYPE_CHECKING:
+    from .server import mcp
 
 __all__ = ["mcp"]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing the server builds the FastMCP app and initializes the client,
+    # so only do it when `mcp` is requested rather than for any submodule import
+    if name == "mcp":
+        from .server import mcp
+
+        return mcp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
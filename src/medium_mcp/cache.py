@@ -0,0 +1,195 @@
+"""
+In-process TTL cache for Medium API responses, plus the optional on-disk
+article content cache.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any, TypeVar, cast
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover - optional dependency
+    diskcache = None
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# Entries older than their TTL are served stale (while being refreshed in the
+# background) until they reach this multiple of the TTL.
+STALE_FACTOR = 2.0
+
+# Set while a fetch runs when its result is incomplete and must not be cached
+_incomplete: ContextVar[bool] = ContextVar("_incomplete", default=False)
+
+
+def mark_incomplete() -> None:
+    """Keep the result of the fetch currently running out of the cache.
+
+    Used when a result is returned despite some of its parts failing to load,
+    so the next call fetches it again instead of serving the partial value.
+    """
+    _incomplete.set(True)
+
+
+class AsyncTTLCache:
+    """Async TTL cache with stale-while-revalidate semantics."""
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize an empty cache holding at most `maxsize` entries."""
+        self.maxsize = maxsize
+        self._entries: dict[str, tuple[float, Any]] = {}
+        # Per-key fetch locks, dropped once their last caller is done
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: dict[str, int] = {}
+        self._refreshing: dict[str, asyncio.Task[None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached entries and cancel pending background refreshes."""
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+        self._entries.clear()
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            oldest = next(iter(self._entries))
+            del self._entries[oldest]
+        self._entries[key] = (monotonic(), value)
+
+    async def fetch_and_set(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Await `fetch` and store its result unless it was marked incomplete."""
+        token = _incomplete.set(False)
+        try:
+            value = await fetch()
+            if not _incomplete.get():
+                self.set(key, value)
+            return value
+        finally:
+            _incomplete.reset(token)
+
+    async def _refresh(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+        """Re-fetch a stale entry, keeping the stale value on failure."""
+        try:
+            await self.fetch_and_set(key, fetch)
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {key}: {e}")
+        finally:
+            # clear() may have replaced this task with a newer refresh
+            if self._refreshing.get(key) is asyncio.current_task():
+                del self._refreshing[key]
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: float,
+        stale_ttl: float,
+    ) -> Any:
+        """Return the cached value for `key`, fetching it when missing.
+
+        Entries younger than `ttl` are returned as is. Entries younger than
+        `stale_ttl` are returned immediately while a background task refreshes
+        them. Older entries are fetched again, with concurrent callers for the
+        same key sharing a single fetch.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = monotonic() - entry[0]
+            if age < ttl:
+                return entry[1]
+            if age < stale_ttl:
+                if key not in self._refreshing:
+                    self._refreshing[key] = asyncio.create_task(
+                        self._refresh(key, fetch)
+                    )
+                return entry[1]
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                # Another caller may have filled the entry while we waited
+                entry = self._entries.get(key)
+                if entry is not None and monotonic() - entry[0] < ttl:
+                    return entry[1]
+
+                return await self.fetch_and_set(key, fetch)
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+
+def cached(ttl_setting: str) -> Callable[[F], F]:
+    """Cache the result of an async MediumClient method.
+
+    The TTL in seconds is read from the `ttl_setting` field of the client's
+    config on every call; a TTL of 0 disables caching for that method. Calls
+    made with `force_refresh=True` skip the lookup, pass the flag on to the
+    method and replace the cached value with the fresh result. Results the
+    method flags with `mark_incomplete` are returned but not cached.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            ttl = getattr(self.config, ttl_setting)
+            if ttl <= 0:
+                return await func(self, *args, **kwargs)
+
+            force_refresh = kwargs.pop("force_refresh", False)
+            key = f"{func.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+            if force_refresh:
+                return await self._cache.fetch_and_set(
+                    key, lambda: func(self, *args, force_refresh=True, **kwargs)
+                )
+
+            return await self._cache.get_or_fetch(
+                key,
+                lambda: func(self, *args, **kwargs),
+                ttl=ttl,
+                stale_ttl=ttl * STALE_FACTOR,
+            )
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def open_disk_cache(directory: str | None) -> Any:
+    """Open the persistent cache in `directory`.
+
+    Returns None when no directory is configured, when the optional
+    diskcache package is not installed or when the cache cannot be opened.
+    """
+    if not directory:
+        return None
+    if diskcache is None:
+        logger.warning(
+            "CACHE_DIR is set but diskcache is not installed; "
+            "install medium-mcp[cache] to enable the persistent cache"
+        )
+        return None
+    try:
+        return diskcache.Cache(os.path.expanduser(directory))
+    except Exception as e:
+        logger.warning(
+            f"Failed to open the persistent cache in {directory}: {e}; "
+            "continuing without it"
+        )
+        return None
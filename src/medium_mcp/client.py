@@ -2,22 +2,99 @@
 Medium API client wrapper with error handling.
 """
 
+import asyncio
 import logging
+import re
+from types import MappingProxyType
+from typing import Any
 
-from medium_api import Medium
+import httpx
+from pydantic import ValidationError
 
+from .cache import AsyncTTLCache, cached, mark_incomplete, open_disk_cache
 from .config import MediumMCPConfig
-from .formatting import convert_to_string, normalize_tag
+from .formatting import convert_api_date, convert_to_string, normalize_tag
 from .models import (
+    ARTICLE_LIST_ADAPTER,
     ArticleContent,
     MediumArticle,
     MediumError,
     MediumUser,
 )
-from .utils import safe_getattr
 
 logger = logging.getLogger(__name__)
 
+RAPIDAPI_HOST = "medium2.p.rapidapi.com"
+BASE_URL = f"https://{RAPIDAPI_HOST}"
+
+# Keep-alive pool shared by every request, so per-article fan-out reuses warm
+# TLS connections instead of handshaking with RapidAPI for each call
+POOL_LIMITS = httpx.Limits(
+    max_connections=32, max_keepalive_connections=32, keepalive_expiry=75
+)
+CONNECT_RETRIES = 3
+
+# Articles are rarely edited, so their content is kept on disk for 30 days
+ARTICLE_CACHE_EXPIRE_S = 30 * 24 * 60 * 60
+
+# User-facing messages for API errors by HTTP status code
+API_ERROR_MESSAGES = {
+    429: "Rate limit exceeded. Please try again later.",
+    401: "Invalid RapidAPI key. Please check your configuration.",
+    404: "Resource not found: {context}",
+}
+
+# Status codes for errors that carry no HTTP response, such as error payloads,
+# keyed by a phrase found in the error message
+ERROR_PHRASE_STATUS = {"rate limit": 429, "unauthorized": 401, "not found": 404}
+_ERROR_PHRASE_PATTERN = re.compile(
+    "|".join(map(re.escape, ERROR_PHRASE_STATUS)), re.IGNORECASE
+)
+
+# Endpoint and response key for each supported article content format
+CONTENT_ENDPOINTS = {
+    "html": ("html", "html"),
+    "markdown": ("markdown", "markdown"),
+    "text": ("content", "content"),
+}
+
+# Defaults for article fields that the API may omit or return as null
+ARTICLE_DEFAULTS: dict[str, Any] = {
+    "article_id": "",
+    "title": "",
+    "subtitle": None,
+    "tags": [],
+    "topics": [],
+    "claps": 0,
+    "voters": 0,
+    "word_count": 0,
+    "reading_time": 0.0,
+    "responses_count": 0,
+    "url": "",
+    "unique_slug": "",
+    "is_locked": False,
+    "is_shortform": False,
+    "language": "en",
+}
+
+
+def _article_data(raw: dict[str, Any], author: str | None = None) -> dict[str, Any]:
+    """Map a raw article info response onto MediumArticle fields.
+
+    The article's own author is used unless `author` is given.
+    """
+    return {
+        **ARTICLE_DEFAULTS,
+        **{key: value for key, value in raw.items() if value is not None},
+        "article_id": raw.get("id") or "",
+        "author": (
+            author if author is not None else convert_to_string(raw.get("author"))
+        ),
+        "published_at": convert_api_date(raw.get("published_at")),
+        "last_modified_at": convert_api_date(raw.get("last_modified_at")),
+        "language": raw.get("lang") or "en",
+    }
+
 
 class MediumClient:
     """Enhanced Medium API client with MCP integration."""
@@ -25,229 +102,303 @@ class MediumClient:
     def __init__(self, config: MediumMCPConfig):
         """Initialize Medium client with configuration."""
         self.config = config
-        self.medium = Medium(config.rapidapi_key)
+        self._session: httpx.AsyncClient | None = None
+        # Built once and shared by every session this client opens
+        self._headers = MappingProxyType(
+            {
+                "x-rapidapi-key": config.rapidapi_key,
+                "x-rapidapi-host": RAPIDAPI_HOST,
+                "accept-encoding": "gzip",
+            }
+        )
+        self._cache = AsyncTTLCache()
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._article_cache = open_disk_cache(config.cache_dir)
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        """Shared HTTP session, opened on first use and reused until closed."""
+        if self._session is None or self._session.is_closed:
+            self._session = httpx.AsyncClient(
+                base_url=BASE_URL,
+                headers=self._headers,
+                transport=httpx.AsyncHTTPTransport(
+                    limits=POOL_LIMITS, retries=CONNECT_RETRIES
+                ),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP session and the persistent cache."""
+        if self._session is not None:
+            await self._session.aclose()
+            self._session = None
+        if self._article_cache is not None:
+            self._article_cache.close()
+
+    async def _get(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Send a GET request to the Medium API and return the JSON body.
+
+        Concurrent calls for the same endpoint and parameters share a single
+        upstream request.
+        """
+        key = f"{endpoint}?{sorted((params or {}).items())!r}"
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._request(endpoint, params))
+            self._inflight[key] = request
+            request.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield the shared request so one cancelled caller doesn't cancel it
+        # for the others
+        return await asyncio.shield(request)
+
+    async def _request(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Send a single GET request and return the JSON body."""
+        response = await self.session.get(endpoint, params=params)
+        response.raise_for_status()
+        data: dict[str, Any] = response.json()
+        if "error" in data:
+            raise MediumError(str(data["error"]))
+        return data
 
     def _handle_api_error(self, error: Exception, context: str) -> None:
         """Handle API errors consistently."""
         error_msg = f"Medium API error in {context}: {str(error)}"
         logger.error(error_msg)
 
-        if "rate limit" in str(error).lower():
-            raise MediumError(
-                "Rate limit exceeded. Please try again later.",
-                status_code=429,
-                details={"context": context},
-            )
-        elif "unauthorized" in str(error).lower():
-            raise MediumError(
-                "Invalid RapidAPI key. Please check your configuration.",
-                status_code=401,
-                details={"context": context},
-            )
-        elif "not found" in str(error).lower():
+        status_code: int | None = None
+        if isinstance(error, httpx.HTTPStatusError):
+            status_code = error.response.status_code
+        elif match := _ERROR_PHRASE_PATTERN.search(str(error)):
+            status_code = ERROR_PHRASE_STATUS[match.group().lower()]
+
+        if status_code in API_ERROR_MESSAGES:
+            message = API_ERROR_MESSAGES[status_code]
             raise MediumError(
-                f"Resource not found: {context}",
-                status_code=404,
+                message.format(context=context),
+                status_code=status_code,
                 details={"context": context},
             )
-        else:
-            raise MediumError(
-                error_msg, details={"context": context, "original_error": str(error)}
-            )
+        raise MediumError(
+            error_msg,
+            status_code=status_code,
+            details={"context": context, "original_error": str(error)},
+        )
+
+    async def _get_user_id(self, username: str) -> str:
+        """Resolve a username to its Medium user ID."""
+        data = await self._get(f"/user/id_for/{username}")
+        return str(data["id"])
+
+    async def _fetch_article_detail(self, article_id: str) -> dict[str, Any]:
+        """Fetch the metadata of a single article."""
+        return await self._get(f"/article/{article_id}")
+
+    async def _fetch_articles(self, article_ids: list[str]) -> list[dict[str, Any]]:
+        """Fetch article metadata for all IDs concurrently.
+
+        Articles that fail to load are logged and skipped, and the partial
+        list is kept out of the cache; the first error is only raised when no
+        article could be fetched at all.
+        """
+        results = await asyncio.gather(
+            *(self._fetch_article_detail(article_id) for article_id in article_ids),
+            return_exceptions=True,
+        )
 
-    def get_user_info(self, username: str) -> MediumUser | None:
+        articles: list[dict[str, Any]] = []
+        errors: list[BaseException] = []
+        for article_id, result in zip(article_ids, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Skipping article {article_id}: {result}")
+                errors.append(result)
+            else:
+                articles.append(result)
+
+        if errors:
+            if not articles:
+                raise errors[0]
+            mark_incomplete()
+        return articles
+
+    @cached("user_ttl_s")
+    async def get_user_info(self, username: str) -> MediumUser | None:
         """Get detailed user information."""
         try:
-            user = self.medium.user(username=username)
+            user_id = await self._get_user_id(username)
+            user = await self._get(f"/user/{user_id}")
 
             return MediumUser(
-                user_id=getattr(user, "user_id", ""),
-                username=user.username,
-                fullname=user.fullname,
-                bio=getattr(user, "bio", None),
-                followers_count=user.followers_count,
-                following_count=getattr(user, "following_count", 0),
-                twitter_username=getattr(user, "twitter_username", None),
-                image_url=getattr(user, "image_url", None),
-                medium_member_at=convert_to_string(
-                    getattr(user, "medium_member_at", None)
-                ),
-                is_writer_program_enrolled=getattr(
-                    user, "is_writer_program_enrolled", False
-                ),
-                has_list=getattr(user, "has_list", False),
-                is_suspended=getattr(user, "is_suspended", False),
+                user_id=user.get("id") or user_id,
+                username=user["username"],
+                fullname=user["fullname"],
+                bio=user.get("bio"),
+                followers_count=user["followers_count"],
+                following_count=user.get("following_count") or 0,
+                twitter_username=user.get("twitter_username"),
+                image_url=user.get("image_url"),
+                medium_member_at=convert_api_date(user.get("medium_member_at")),
+                is_writer_program_enrolled=user.get("is_writer_program_enrolled")
+                or False,
+                has_list=user.get("has_list") or False,
+                is_suspended=user.get("is_suspended") or False,
             )
         except Exception as e:
             self._handle_api_error(e, f"getting user info for {username}")
             return None
 
-    def get_user_articles(
+    @cached("user_ttl_s")
+    async def get_user_articles(
         self, username: str, count: int
     ) -> list[MediumArticle] | None:
         """Get user's articles."""
         try:
-            user = self.medium.user(username=username)
-            user.fetch_articles()
-
-            articles = []
+            user_id = await self._get_user_id(username)
             article_limit = min(count, self.config.max_articles_per_request)
 
-            for article in user.articles[:article_limit]:
-                articles.append(
-                    MediumArticle(
-                        article_id=getattr(article, "article_id", ""),
-                        title=article.title,
-                        subtitle=getattr(article, "subtitle", None),
-                        author=username,
-                        published_at=convert_to_string(
-                            getattr(article, "published_at", "")
-                        ),
-                        last_modified_at=convert_to_string(
-                            getattr(article, "last_modified_at", "")
-                        ),
-                        tags=getattr(article, "tags", []),
-                        topics=getattr(article, "topics", []),
-                        claps=getattr(article, "claps", 0),
-                        voters=getattr(article, "voters", 0),
-                        word_count=getattr(article, "word_count", 0),
-                        reading_time=getattr(article, "reading_time", 0.0),
-                        responses_count=getattr(article, "responses_count", 0),
-                        url=article.url,
-                        unique_slug=getattr(article, "unique_slug", ""),
-                        is_locked=getattr(article, "is_locked", False),
-                        is_shortform=getattr(article, "is_shortform", False),
-                        language=getattr(article, "language", "en"),
-                    )
-                )
-
-            return articles
+            # Only page through the article list until enough IDs are collected
+            article_ids: list[str] = []
+            params: dict[str, Any] | None = None
+            while len(article_ids) < article_limit:
+                page = await self._get(f"/user/{user_id}/articles", params=params)
+                article_ids += page.get("associated_articles") or []
+                if not page.get("next"):
+                    break
+                params = {"next": page["next"]}
+
+            results = await self._fetch_articles(article_ids[:article_limit])
+
+            return ARTICLE_LIST_ADAPTER.validate_python(
+                [_article_data(article, username) for article in results]
+            )
         except Exception as e:
             self._handle_api_error(e, f"getting articles for user {username}")
             return None
 
-    def get_article_content(
-        self, article_id: str, content_format: str = "markdown"
+    async def _load_article_content(self, key: str) -> ArticleContent | None:
+        """Read article content from the persistent cache, if enabled."""
+        if self._article_cache is None:
+            return None
+        try:
+            stored = await asyncio.to_thread(self._article_cache.get, key)
+            return ArticleContent.model_validate_json(stored) if stored else None
+        except ValidationError as e:
+            # Corrupt or written under an older schema: treat it as a miss
+            logger.warning(f"Discarding invalid cached content for {key}: {e}")
+            await self._delete_article_content(key)
+        except Exception as e:
+            logger.warning(f"Failed to read cached content for {key}: {e}")
+        return None
+
+    async def _delete_article_content(self, key: str) -> None:
+        """Remove an entry from the persistent cache, if enabled."""
+        if self._article_cache is None:
+            return
+        try:
+            await asyncio.to_thread(self._article_cache.delete, key)
+        except Exception as e:
+            logger.warning(f"Failed to delete cached content for {key}: {e}")
+
+    async def _save_article_content(self, key: str, content: ArticleContent) -> None:
+        """Write article content to the persistent cache, if enabled."""
+        if self._article_cache is None:
+            return
+        try:
+            await asyncio.to_thread(
+                self._article_cache.set,
+                key,
+                content.json_bytes,
+                expire=ARTICLE_CACHE_EXPIRE_S,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache content for {key}: {e}")
+
+    @cached("content_ttl_s")
+    async def get_article_content(
+        self,
+        article_id: str,
+        content_format: str = "markdown",
+        force_refresh: bool = False,
     ) -> ArticleContent | None:
-        """Get article content in specified format."""
+        """Get article content in specified format.
+
+        Content is served from the persistent cache when one is configured,
+        unless `force_refresh` is set.
+        """
+        cache_key = f"{article_id}:{content_format}"
+        if not force_refresh:
+            stored = await self._load_article_content(cache_key)
+            if stored is not None:
+                return stored
+
         try:
-            article = self.medium.article(article_id=article_id)
+            endpoint, key = CONTENT_ENDPOINTS.get(
+                content_format, CONTENT_ENDPOINTS["text"]
+            )
+            params = {"fullpage": "false"} if content_format == "html" else None
 
-            if content_format == "html":
-                content = article.html
-            elif content_format == "markdown":
-                content = article.markdown
-            else:
-                content = article.content
-
-            # Get author safely
-            author_value = getattr(article, "author", None)
-            if author_value is None:
-                author_value = ""
-
-            # Get published_at safely
-            published_at_value = getattr(article, "published_at", None)
-            if published_at_value is None:
-                published_at_value = ""
-
-            return ArticleContent(
-                title=article.title or "",
-                subtitle=getattr(article, "subtitle", None),
-                content=content or "",
+            # Article info and body are independent requests
+            article, body = await asyncio.gather(
+                self._fetch_article_detail(article_id),
+                self._get(f"/article/{article_id}/{endpoint}", params=params),
+            )
+
+            content = ArticleContent(
+                title=article.get("title") or "",
+                subtitle=article.get("subtitle"),
+                content=body.get(key) or "",
                 content_format=content_format,
-                author=convert_to_string(author_value),
-                published_at=convert_to_string(published_at_value),
+                author=convert_to_string(article.get("author")),
+                published_at=convert_api_date(article.get("published_at")),
             )
         except Exception as e:
             self._handle_api_error(e, f"getting content for article {article_id}")
             return None
 
-    def get_top_feeds(
+        await self._save_article_content(cache_key, content)
+        return content
+
+    @cached("topfeeds_ttl_s")
+    async def get_top_feeds(
         self, tag: str | None, mode: str, count: int
     ) -> list[MediumArticle] | None:
         """Get top feed articles, optionally filtered by tag."""
         try:
-            top_feeds = self.medium.topfeeds(tag=normalize_tag(tag), mode=mode)
-            results = top_feeds.articles
+            top_feeds = await self._get(f"/topfeeds/{normalize_tag(tag) or ''}/{mode}")
+            results = top_feeds.get("topfeeds") or []
 
             # Limit results to top count items
             article_limit = min(count, self.config.max_articles_per_request)
-            results = results[:article_limit]
-            self.medium.fetch_articles(results, html_fullpage=False)
-            articles = []
-            for article in results:
-                articles.append(
-                    MediumArticle(
-                        article_id=getattr(article, "article_id", ""),
-                        title=article.title,
-                        subtitle=getattr(article, "subtitle", None),
-                        author=convert_to_string(getattr(article, "author", "")),
-                        published_at=convert_to_string(
-                            getattr(article, "published_at", "")
-                        ),
-                        last_modified_at=convert_to_string(
-                            getattr(article, "last_modified_at", "")
-                        ),
-                        tags=getattr(article, "tags", []),
-                        topics=getattr(article, "topics", []),
-                        claps=getattr(article, "claps", 0),
-                        voters=getattr(article, "voters", 0),
-                        word_count=getattr(article, "word_count", 0),
-                        reading_time=getattr(article, "reading_time", 0.0),
-                        responses_count=getattr(article, "responses_count", 0),
-                        url=article.url,
-                        unique_slug=getattr(article, "unique_slug", ""),
-                        is_locked=getattr(article, "is_locked", False),
-                        is_shortform=getattr(article, "is_shortform", False),
-                        language=getattr(article, "language", "en"),
-                    )
-                )
-
-            return articles
+            articles = await self._fetch_articles(results[:article_limit])
+
+            return ARTICLE_LIST_ADAPTER.validate_python(
+                [_article_data(article) for article in articles]
+            )
         except Exception as e:
             self._handle_api_error(e, f"getting top feeds for tag {tag}")
             return None
 
-    def search_articles(self, query: str, count: int) -> list[MediumArticle] | None:
+    @cached("topfeeds_ttl_s")
+    async def search_articles(
+        self, query: str, count: int
+    ) -> list[MediumArticle] | None:
+        """Search articles by keyword."""
         try:
-            # Note: Medium API search_articles doesn't support count parameter
-            results = self.medium.search_articles(query=query)
+            # Note: Medium API search doesn't support a count parameter
+            search = await self._get("/search/articles", params={"query": query})
+            results = search.get("articles") or []
 
             # Limit results to top count items
             article_limit = min(count, self.config.max_articles_per_request)
-            results = results[:article_limit]
-            self.medium.fetch_articles(results, html_fullpage=False)
-
-            articles = []
-            for article in results:
-                articles.append(
-                    MediumArticle(
-                        article_id=safe_getattr(article, "article_id", ""),
-                        title=safe_getattr(article, "title", ""),
-                        subtitle=safe_getattr(article, "subtitle", None),
-                        author=convert_to_string(safe_getattr(article, "author", "")),
-                        published_at=convert_to_string(
-                            safe_getattr(article, "published_at", "")
-                        ),
-                        last_modified_at=convert_to_string(
-                            safe_getattr(article, "last_modified_at", "")
-                        ),
-                        tags=safe_getattr(article, "tags", []),
-                        topics=safe_getattr(article, "topics", []),
-                        claps=safe_getattr(article, "claps", 0),
-                        voters=safe_getattr(article, "voters", 0),
-                        word_count=safe_getattr(article, "word_count", 0),
-                        reading_time=safe_getattr(article, "reading_time", 0.0),
-                        responses_count=safe_getattr(article, "responses_count", 0),
-                        url=safe_getattr(article, "url", ""),
-                        unique_slug=safe_getattr(article, "unique_slug", ""),
-                        is_locked=safe_getattr(article, "is_locked", False),
-                        is_shortform=safe_getattr(article, "is_shortform", False),
-                        language=safe_getattr(article, "language", "en"),
-                    )
-                )
-
-            return articles
+            articles = await self._fetch_articles(results[:article_limit])
+
+            return ARTICLE_LIST_ADAPTER.validate_python(
+                [_article_data(article) for article in articles]
+            )
         except Exception as e:
             self._handle_api_error(e, f"searching articles with query: {query}")
             return None
@@ -2,11 +2,20 @@
 
 import os
 
-from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator
 
-# Load environment variables from .env file
-load_dotenv()
+_env_loaded = False
+
+
+def _ensure_env_loaded() -> None:
+    """Load environment variables from a .env file on first use."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    _env_loaded = True
 
 
 class MediumMCPConfig(BaseModel):
@@ -25,6 +34,30 @@ class MediumMCPConfig(BaseModel):
         default="INFO", description="Logging level (DEBUG, INFO, WARNING, ERROR)"
     )
 
+    user_ttl_s: int = Field(
+        default=6 * 60 * 60,
+        ge=0,
+        description="Cache TTL in seconds for user profiles and article lists",
+    )
+
+    topfeeds_ttl_s: int = Field(
+        default=5 * 60,
+        ge=0,
+        description="Cache TTL in seconds for top feeds and search results",
+    )
+
+    content_ttl_s: int = Field(
+        default=24 * 60 * 60,
+        ge=0,
+        description="Cache TTL in seconds for article content",
+    )
+
+    cache_dir: str | None = Field(
+        default=None,
+        description="Directory for the persistent article content cache "
+        "(disabled when unset)",
+    )
+
     @field_validator("rapidapi_key")
     @classmethod
     def validate_rapidapi_key(cls, v: str) -> str:
@@ -36,6 +69,7 @@ class MediumMCPConfig(BaseModel):
     @classmethod
     def from_env(cls) -> "MediumMCPConfig":
         """Create config from environment variables."""
+        _ensure_env_loaded()
         rapidapi_key = os.getenv("RAPIDAPI_KEY")
         if not rapidapi_key:
             raise ValueError(
@@ -47,4 +81,8 @@ class MediumMCPConfig(BaseModel):
             rapidapi_key=rapidapi_key,
             max_articles_per_request=int(os.getenv("MAX_ARTICLES_PER_REQUEST", "3")),
             log_level=os.getenv("LOG_LEVEL", "INFO").upper(),
+            user_ttl_s=int(os.getenv("USER_CACHE_TTL", "21600")),
+            topfeeds_ttl_s=int(os.getenv("TOPFEEDS_CACHE_TTL", "300")),
+            content_ttl_s=int(os.getenv("CONTENT_CACHE_TTL", "86400")),
+            cache_dir=os.getenv("CACHE_DIR") or None,
         )
@@ -2,6 +2,8 @@
 String and data formatting functions for the Medium MCP package.
 """
 
+from collections.abc import Callable
+from datetime import date, datetime
 from typing import Any
 
 
@@ -9,16 +11,46 @@ def normalize_tag(tag: str) -> str:
     """Convert user input tag to Medium API format (lowercase with hyphens)."""
     if not tag:
         return tag
-    return tag.lower().replace(" ", "-")
+    tag = tag.lower()
+    return tag.replace(" ", "-") if " " in tag else tag
+
+
+# Converters for the exact types most values arrive as, checked before the
+# slower attribute probing below
+_STRING_CONVERTERS: dict[type, Callable[[Any], str]] = {
+    str: lambda value: value,
+    datetime: lambda value: value.isoformat(),
+    date: lambda value: value.isoformat(),
+    type(None): lambda value: "",
+}
 
 
 def convert_to_string(value: Any) -> str:
     """Convert various value types to strings safely."""
-    if value is None or value == "":
-        return ""
+    converter = _STRING_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
     elif hasattr(value, "username") and value.username:
         return str(value.username)
     elif hasattr(value, "isoformat"):
         return value.isoformat()
     else:
         return str(value) if value else ""
+
+
+# Timestamp format used by the Medium API for dates such as published_at
+API_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def convert_api_date(value: Any) -> str:
+    """Convert a Medium API timestamp to an ISO-8601 string.
+
+    Values that are not in the API's timestamp format are converted with
+    convert_to_string unchanged.
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.strptime(value, API_DATE_FORMAT).isoformat()
+        except ValueError:
+            return value
+    return convert_to_string(value)
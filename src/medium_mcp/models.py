@@ -1,11 +1,41 @@
 """Type definitions for Medium MCP server."""
 
+from collections.abc import Mapping
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from typing_extensions import Self
 
 
-class MediumUser(BaseModel):
+class _SerializedModel(BaseModel):
+    """Immutable model that memoizes its JSON encoding.
+
+    Instances are shared through the client's response cache, so the encoding
+    is computed once and reused by every tool call that returns them.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    @cached_property
+    def json_bytes(self) -> bytes:
+        """Compact JSON encoding of the model.
+
+        Serialized straight to bytes by pydantic's compiled serializer,
+        without building an intermediate dict.
+        """
+        return self.__pydantic_serializer__.to_json(self)
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the model without carrying over a stale cached encoding."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied.__dict__.pop("json_bytes", None)
+        return copied
+
+
+class MediumUser(_SerializedModel):
     """Medium user information."""
 
     user_id: str = Field(..., description="Unique user identifier")
@@ -22,7 +52,7 @@ class MediumUser(BaseModel):
     is_suspended: bool = Field(False, description="Account suspension status")
 
 
-class MediumArticle(BaseModel):
+class MediumArticle(_SerializedModel):
     """Medium article information."""
 
     article_id: str = Field(..., description="Unique article identifier")
@@ -45,9 +75,15 @@ class MediumArticle(BaseModel):
     language: str = Field("en", description="Content language")
 
 
+# Validates whole article lists in one call
+ARTICLE_LIST_ADAPTER = TypeAdapter(list[MediumArticle])
+
+
 class MediumComment(BaseModel):
     """Medium comment/response information."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     comment_id: str = Field(..., description="Unique comment identifier")
     author: str = Field(..., description="Comment author username")
     content: str = Field(..., description="Comment content")
@@ -55,7 +91,7 @@ class MediumComment(BaseModel):
     created_at: str = Field(..., description="Comment creation date")
 
 
-class ArticleContent(BaseModel):
+class ArticleContent(_SerializedModel):
     """Article content in different formats."""
 
     title: str = Field(..., description="Article title")
@@ -71,6 +107,8 @@ class ArticleContent(BaseModel):
 class SearchResult(BaseModel):
     """Search results container."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     query: str = Field(..., description="Search query used")
     total_results: int = Field(..., description="Total number of results")
     articles: list[MediumArticle] = Field(
@@ -6,35 +6,51 @@ Available MCP Tools:
 - get_article_content: Get full article content in various formats
 - get_top_feeds: Get trending articles, optionally filtered by tag
 - search_articles: Search articles by keyword/query
+- get_user_profile_with_articles: Get a user's profile and articles in one call
+- get_articles_bulk: Get the content of several articles in one call
 
 Note: Publication-related tools have been removed from this version.
 """
 
+import asyncio
 import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Literal
 
 from mcp.server.fastmcp import FastMCP
 
-try:
-    # Relative imports (when run as module)
-    from .client import MediumClient
-    from .config import MediumMCPConfig
-    from .models import MediumError
-except ImportError:
-    # Absolute imports (when run directly)
-    from medium_mcp.client import MediumClient
-    from medium_mcp.config import MediumMCPConfig
-    from medium_mcp.models import MediumError
+from .client import MediumClient
+from .config import MediumMCPConfig
+from .models import ArticleContent, MediumArticle, MediumError
 
 logger = logging.getLogger(__name__)
 
-# Initialize MCP server
-mcp = FastMCP("Medium MCP Server", dependencies=["pydantic", "medium-api"])
-
 # Global client instance
 client: MediumClient | None = None
 
+# Supported article content formats
+_VALID_FORMATS = frozenset({"text", "html", "markdown"})
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the client's HTTP session when the server shuts down."""
+    try:
+        yield
+    finally:
+        if client is not None:
+            await client.aclose()
+
+
+# Initialize MCP server
+mcp = FastMCP(
+    "Medium MCP Server",
+    dependencies=["pydantic", "httpx"],
+    lifespan=lifespan,
+)
+
 
 def initialize_client() -> None:
     """Initialize the Medium client."""
@@ -48,6 +64,11 @@ def initialize_client() -> None:
         raise
 
 
+def dump_articles(articles: list[MediumArticle] | None) -> str:
+    """Join the articles' cached JSON encodings into a JSON array."""
+    return (b"[" + b",".join(a.json_bytes for a in articles or []) + b"]").decode()
+
+
 def ensure_client() -> MediumClient:
     """Ensure client is initialized and return it."""
     if client is None:
@@ -58,7 +79,7 @@ def ensure_client() -> MediumClient:
 
 
 @mcp.tool()
-def get_user_info(username: str) -> str:
+async def get_user_info(username: str) -> str:
     """Get detailed information about a Medium user.
 
     Args:
@@ -69,10 +90,8 @@ def get_user_info(username: str) -> str:
     """
     try:
         medium_client = ensure_client()
-        user = medium_client.get_user_info(username)
-        return json.dumps(
-            user.model_dump() if user else None, indent=2, ensure_ascii=False
-        )
+        user = await medium_client.get_user_info(username)
+        return user.json_bytes.decode() if user else "null"
     except MediumError as e:
         logger.error(f"Medium API error: {e.message}")
         raise Exception(f"Medium API Error: {e.message}")
@@ -82,12 +101,11 @@ def get_user_info(username: str) -> str:
 
 
 @mcp.tool()
-def get_user_articles(username: str, count: int = 3) -> str:
+async def get_user_articles(username: str, count: int = 3) -> str:
     """Get articles written by a specific Medium user.
 
-    WARNING: This function will consume API requests proportional to the number of
-    articles published by the user. The cost increases significantly for prolific
-    authors with hundreds or thousands of published articles.
+    WARNING: This function makes one API request per returned article, plus one
+    per page of the user's article list read until {count} articles are found.
 
     Args:
         username: Medium username (without @)
@@ -97,16 +115,12 @@ def get_user_articles(username: str, count: int = 3) -> str:
         JSON string with user's articles
     """
     try:
-        if count < 1 or count > 100:
+        if not (1 <= count <= 100):
             raise ValueError("Count must be between 1 and 100")
 
         medium_client = ensure_client()
-        articles = medium_client.get_user_articles(username, count)
-        return json.dumps(
-            [article.model_dump() for article in articles] if articles else [],
-            indent=2,
-            ensure_ascii=False,
-        )
+        articles = await medium_client.get_user_articles(username, count)
+        return dump_articles(articles)
     except MediumError as e:
         logger.error(f"Medium API error: {e.message}")
         raise Exception(f"Medium API Error: {e.message}")
@@ -116,7 +130,9 @@ def get_user_articles(username: str, count: int = 3) -> str:
 
 
 @mcp.tool()
-def get_article_content(article_id: str, format: str = "text") -> str:
+async def get_article_content(
+    article_id: str, format: str = "text", force_refresh: bool = False
+) -> str:
     """Get full content of a Medium article, including member-only stories.
     
     This tool can access the complete content of Medium articles, even those marked as 
@@ -132,19 +148,20 @@ def get_article_content(article_id: str, format: str = "text") -> str:
     Args:
         article_id: Unique Medium article ID (extract from URL's last section)
         format: Content format - "text" (default), "html", or "markdown"
+        force_refresh: Fetch the latest content instead of a cached copy
 
     Returns:
         JSON string with complete article content including title, content, author, and metadata
     """
     try:
-        if format not in ["text", "html", "markdown"]:
+        if format not in _VALID_FORMATS:
             raise ValueError("Format must be 'text', 'html', or 'markdown'")
 
         medium_client = ensure_client()
-        content = medium_client.get_article_content(article_id, format)
-        return json.dumps(
-            content.model_dump() if content else None, indent=2, ensure_ascii=False
+        content = await medium_client.get_article_content(
+            article_id, format, force_refresh=force_refresh
         )
+        return content.json_bytes.decode() if content else "null"
     except MediumError as e:
         logger.error(f"Medium API error: {e.message}")
         raise Exception(f"Medium API Error: {e.message}")
@@ -157,9 +174,10 @@ FeedMode = Literal["hot", "new", "top_year", "top_month", "top_week", "top_all_t
 
 # Extract valid modes from the Literal type for runtime validation
 VALID_FEED_MODES = list(FeedMode.__args__)
+_VALID_MODES = frozenset(VALID_FEED_MODES)
 
 @mcp.tool()
-def get_top_feeds(tag: str = "", mode: FeedMode = "top_month", count: int = 3) -> str:
+async def get_top_feeds(tag: str = "", mode: FeedMode = "top_month", count: int = 3) -> str:
     """Get top trending articles from Medium.
 
     Args:
@@ -171,20 +189,16 @@ def get_top_feeds(tag: str = "", mode: FeedMode = "top_month", count: int = 3) -
         JSON string with trending articles
     """
     try:
-        if count < 1 or count > 100:
+        if not (1 <= count <= 100):
             raise ValueError("Count must be between 1 and 100")
         
         # Validate mode parameter
-        if mode not in VALID_FEED_MODES:
+        if mode not in _VALID_MODES:
             raise ValueError(f"Invalid mode '{mode}'. Must be one of: {', '.join(VALID_FEED_MODES)}")
 
         medium_client = ensure_client()
-        articles = medium_client.get_top_feeds(tag, mode, count)
-        return json.dumps(
-            [article.model_dump() for article in articles] if articles else [],
-            indent=2,
-            ensure_ascii=False,
-        )
+        articles = await medium_client.get_top_feeds(tag, mode, count)
+        return dump_articles(articles)
     except MediumError as e:
         logger.error(f"Medium API error: {e.message}")
         raise Exception(f"Medium API Error: {e.message}")
@@ -194,12 +208,12 @@ def get_top_feeds(tag: str = "", mode: FeedMode = "top_month", count: int = 3) -
 
 
 @mcp.tool()
-def search_articles(query: str, count: int = 3) -> str:
+async def search_articles(query: str, count: int = 3) -> str:
     """Search Medium articles by keyword.
 
     WARNING: This function makes additional API calls to fetch detailed article information.
     The search results initially contain only article IDs. To get complete article metadata,
-    fetch_articles() is called, which makes {count} additional API requests - 1 per article.
+    {count} additional API requests are made - 1 per article, issued concurrently.
     This will consume extra API quota and incur additional costs on your RapidAPI plan.
 
     Args:
@@ -213,16 +227,12 @@ def search_articles(query: str, count: int = 3) -> str:
         if not query.strip():
             raise ValueError("Search query cannot be empty")
 
-        if count < 1 or count > 100:
+        if not (1 <= count <= 100):
             raise ValueError("Count must be between 1 and 100")
 
         medium_client = ensure_client()
-        articles = medium_client.search_articles(query, count)
-        return json.dumps(
-            [article.model_dump() for article in articles] if articles else [],
-            indent=2,
-            ensure_ascii=False,
-        )
+        articles = await medium_client.search_articles(query, count)
+        return dump_articles(articles)
     except MediumError as e:
         logger.error(f"Medium API error: {e.message}")
         raise Exception(f"Medium API Error: {e.message}")
@@ -231,6 +241,105 @@ def search_articles(query: str, count: int = 3) -> str:
         raise Exception(f"Error: {str(e)}")
 
 
+@mcp.tool()
+async def get_user_profile_with_articles(username: str, count: int = 3) -> str:
+    """Get a Medium user's profile together with their articles.
+
+    Fetches the same data as get_user_info and get_user_articles, with both
+    lookups running concurrently. The same API usage warning as
+    get_user_articles applies.
+
+    Args:
+        username: Medium username (without @)
+        count: Number of articles to fetch (max 100)
+
+    Returns:
+        JSON string with "user" and "articles" keys
+    """
+    try:
+        if not (1 <= count <= 100):
+            raise ValueError("Count must be between 1 and 100")
+
+        medium_client = ensure_client()
+        user, articles = await asyncio.gather(
+            medium_client.get_user_info(username),
+            medium_client.get_user_articles(username, count),
+        )
+        user_json = user.json_bytes.decode() if user else "null"
+        return f'{{"user":{user_json},"articles":{dump_articles(articles)}}}'
+    except MediumError as e:
+        logger.error(f"Medium API error: {e.message}")
+        raise Exception(f"Medium API Error: {e.message}")
+    except Exception as e:
+        logger.error(f"Unexpected error getting user profile with articles: {e}")
+        raise Exception(f"Error: {str(e)}")
+
+
+@mcp.tool()
+async def get_articles_bulk(article_ids: list[str], format: str = "text") -> str:
+    """Get the full content of several Medium articles at once.
+
+    Each article costs the same API requests as get_article_content; the
+    requests for all articles are issued concurrently.
+
+    Args:
+        article_ids: Unique Medium article IDs (max 100)
+        format: Content format - "text" (default), "html", or "markdown"
+
+    Returns:
+        JSON string mapping each article ID to its content, or null when the
+        article could not be fetched
+    """
+    try:
+        article_ids = list(dict.fromkeys(article_ids))
+        if not (1 <= len(article_ids) <= 100):
+            raise ValueError("Number of article IDs must be between 1 and 100")
+
+        if format not in _VALID_FORMATS:
+            raise ValueError("Format must be 'text', 'html', or 'markdown'")
+
+        medium_client = ensure_client()
+        results = await asyncio.gather(
+            *(
+                medium_client.get_article_content(article_id, format)
+                for article_id in article_ids
+            ),
+            return_exceptions=True,
+        )
+
+        contents: dict[str, ArticleContent | None] = {}
+        errors: list[BaseException] = []
+        for article_id, result in zip(article_ids, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Skipping article {article_id}: {result}")
+                errors.append(result)
+                contents[article_id] = None
+            else:
+                contents[article_id] = result
+
+        # Only fail the call when no article could be fetched at all
+        if len(errors) == len(article_ids):
+            raise errors[0]
+
+        entries = (
+            f"{json.dumps(article_id)}:"
+            + (content.json_bytes.decode() if content else "null")
+            for article_id, content in contents.items()
+        )
+        return "{" + ",".join(entries) + "}"
+    except MediumError as e:
+        logger.error(f"Medium API error: {e.message}")
+        raise Exception(f"Medium API Error: {e.message}")
+    except Exception as e:
+        logger.error(f"Unexpected error getting articles in bulk: {e}")
+        raise Exception(f"Error: {str(e)}")
+
+
+def main() -> None:
+    """Run the MCP server over stdio."""
+    mcp.run()
+
+
 # Initialize client when module is imported (for MCP framework)
 try:
     initialize_client()
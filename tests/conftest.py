@@ -0,0 +1,93 @@
+"""Shared pytest configuration for the Medium MCP test suite."""
+
+import os
+import sys
+from unittest.mock import create_autospec
+
+import pytest
+
+from medium_mcp.client import MediumClient
+from medium_mcp.models import ArticleContent, MediumArticle, MediumUser
+
+# Benchmark modules are only collected for `pytest --benchmark-only`
+collect_ignore_glob = [] if "--benchmark-only" in sys.argv else ["test_bench_*.py"]
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio, the event loop the MCP server uses."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_env():
+    """Provide a RapidAPI key for the whole session unless one is already set."""
+    if "RAPIDAPI_KEY" in os.environ:
+        yield
+        return
+    os.environ["RAPIDAPI_KEY"] = "test_api_key_123456789012345"
+    yield
+    os.environ.pop("RAPIDAPI_KEY", None)
+
+
+@pytest.fixture(scope="session")
+def _client():
+    """Single MediumClient mock shared by the whole session."""
+    return create_autospec(MediumClient, instance=True)
+
+
+@pytest.fixture
+def mock_client(_client, monkeypatch):
+    """Mock MediumClient returned by the server's ensure_client."""
+    _client.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("medium_mcp.server.ensure_client", lambda: _client)
+    return _client
+
+
+@pytest.fixture(scope="session")
+def mock_user():
+    """Mock MediumUser for testing."""
+    return MediumUser(
+        user_id="123456",
+        username="testuser",
+        fullname="Test User",
+        followers_count=1000,
+        following_count=500,
+    )
+
+
+@pytest.fixture(scope="session")
+def article_factory():
+    """Build MediumArticles from shared defaults plus keyword overrides."""
+    base = dict(
+        article_id="abc123",
+        title="Test Article",
+        author="testuser",
+        published_at="2024-01-01",
+        last_modified_at="2024-01-02",
+        url="https://medium.com/@testuser/test-article",
+        unique_slug="test-article",
+    )
+
+    def make(**overrides):
+        return MediumArticle(**{**base, **overrides})
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def mock_article(article_factory):
+    """Mock MediumArticle for testing."""
+    return article_factory()
+
+
+@pytest.fixture(scope="session")
+def mock_article_content():
+    """Mock ArticleContent for testing."""
+    return ArticleContent(
+        title="Test Article",
+        content="This is test content",
+        content_format="text",
+        author="testuser",
+        published_at="2024-01-01",
+    )
@@ -0,0 +1,62 @@
+"""Micro-benchmarks for the formatting hot paths.
+
+Run with ``pytest tests/test_bench_formatting.py --benchmark-only``.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from medium_mcp.formatting import convert_to_string, normalize_tag
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark(disable_gc=True, warmup=True)
+
+TAG = "Machine Learning Tutorial"
+
+_HYPHENATE = str.maketrans(" ", "-")
+
+
+def _normalize_tag_replace(tag):
+    return tag.lower().replace(" ", "-") if tag else tag
+
+
+def _normalize_tag_translate(tag):
+    return tag.lower().translate(_HYPHENATE) if tag else tag
+
+
+# Candidate implementations compared against the shipped normalize_tag
+NORMALIZE_TAG_CANDIDATES = {
+    "current": normalize_tag,
+    "replace": _normalize_tag_replace,
+    "translate": _normalize_tag_translate,
+}
+
+
+class _User:
+    __slots__ = ("username",)
+
+    def __init__(self, username):
+        self.username = username
+
+
+@pytest.mark.parametrize("name", list(NORMALIZE_TAG_CANDIDATES))
+def test_bench_normalize_tag(benchmark, name):
+    """Benchmark normalize_tag against alternative implementations."""
+    benchmark.group = "normalize_tag"
+    func = NORMALIZE_TAG_CANDIDATES[name]
+
+    assert benchmark(func, TAG) == "machine-learning-tutorial"
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["author", datetime(2024, 1, 15, 10, 30), None, _User("author"), 42],
+    ids=["str", "datetime", "none", "user", "int"],
+)
+def test_bench_convert_to_string(benchmark, value):
+    """Benchmark convert_to_string for each kind of value it handles."""
+    benchmark.group = "convert_to_string"
+
+    benchmark(convert_to_string, value)
@@ -0,0 +1,247 @@
+"""Tests for the async TTL cache."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from medium_mcp.cache import AsyncTTLCache, cached, mark_incomplete, open_disk_cache
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for the cache's monotonic clock."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr("medium_mcp.cache.monotonic", lambda: now.value)
+    return now
+
+
+@pytest.fixture
+def cache():
+    """Empty cache for testing."""
+    return AsyncTTLCache()
+
+
+class TestAsyncTTLCache:
+    """Test AsyncTTLCache behaviour."""
+
+    async def test_miss_fetches_and_stores(self, cache, clock):
+        """Test a miss awaits the fetch and caches the value."""
+        fetch = AsyncMock(return_value="value")
+
+        assert await cache.get_or_fetch("key", fetch, ttl=10, stale_ttl=20) == "value"
+        assert await cache.get_or_fetch("key", fetch, ttl=10, stale_ttl=20) == "value"
+
+        fetch.assert_awaited_once()
+        assert len(cache) == 1
+
+    async def test_stale_entry_served_while_refreshing(self, cache, clock):
+        """Test a stale hit returns the old value and refreshes it in the background."""
+        await cache.get_or_fetch(
+            "key", AsyncMock(return_value="old"), ttl=10, stale_ttl=20
+        )
+        clock.value += 15
+        fetch = AsyncMock(return_value="new")
+
+        assert await cache.get_or_fetch("key", fetch, ttl=10, stale_ttl=20) == "old"
+        await asyncio.sleep(0)
+
+        fetch.assert_awaited_once()
+        assert await cache.get_or_fetch("key", fetch, ttl=10, stale_ttl=20) == "new"
+
+    async def test_failed_refresh_keeps_stale_value(self, cache, clock):
+        """Test a failing background refresh leaves the stale value in place."""
+        await cache.get_or_fetch(
+            "key", AsyncMock(return_value="old"), ttl=10, stale_ttl=20
+        )
+        clock.value += 15
+
+        failing = AsyncMock(side_effect=Exception("boom"))
+        assert await cache.get_or_fetch("key", failing, ttl=10, stale_ttl=20) == "old"
+        await asyncio.sleep(0)
+
+        assert await cache.get_or_fetch("key", failing, ttl=10, stale_ttl=20) == "old"
+
+    async def test_clear_cancels_pending_refresh(self, cache, clock):
+        """Test a refresh running during clear() does not repopulate the cache."""
+        await cache.get_or_fetch(
+            "key", AsyncMock(return_value="old"), ttl=10, stale_ttl=20
+        )
+        clock.value += 15
+        release = asyncio.Event()
+
+        async def slow_fetch():
+            await release.wait()
+            return "new"
+
+        assert (
+            await cache.get_or_fetch("key", slow_fetch, ttl=10, stale_ttl=20) == "old"
+        )
+        await asyncio.sleep(0)
+        cache.clear()
+        release.set()
+        await asyncio.sleep(0)
+
+        assert len(cache) == 0
+
+    async def test_expired_entry_refetched(self, cache, clock):
+        """Test entries past the stale window are fetched again."""
+        await cache.get_or_fetch(
+            "key", AsyncMock(return_value="old"), ttl=10, stale_ttl=20
+        )
+        clock.value += 25
+
+        fetch = AsyncMock(return_value="new")
+        assert await cache.get_or_fetch("key", fetch, ttl=10, stale_ttl=20) == "new"
+
+    async def test_concurrent_misses_share_fetch(self, cache, clock):
+        """Test concurrent callers for one key trigger a single fetch."""
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return "value"
+
+        results = await asyncio.gather(
+            *(cache.get_or_fetch("key", fetch, ttl=10, stale_ttl=20) for _ in range(5))
+        )
+
+        assert results == ["value"] * 5
+        assert calls == 1
+
+    async def test_errors_not_cached(self, cache, clock):
+        """Test failed fetches propagate and are not stored."""
+        with pytest.raises(ValueError):
+            await cache.get_or_fetch(
+                "key", AsyncMock(side_effect=ValueError("boom")), ttl=10, stale_ttl=20
+            )
+
+        assert len(cache) == 0
+        assert not cache._locks
+
+    async def test_locks_released_after_fetch(self, cache, clock):
+        """Test fetch locks are dropped once no caller is waiting on them."""
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return "value"
+
+        await asyncio.gather(
+            *(cache.get_or_fetch("key", fetch, ttl=10, stale_ttl=20) for _ in range(3))
+        )
+
+        assert calls == 1
+        assert not cache._locks
+        assert not cache._lock_users
+
+    async def test_maxsize_evicts_oldest(self, clock):
+        """Test the oldest entry is evicted once the cache is full."""
+        cache = AsyncTTLCache(maxsize=2)
+        for key in ("a", "b", "c"):
+            await cache.get_or_fetch(
+                key, AsyncMock(return_value=key), ttl=10, stale_ttl=20
+            )
+
+        fetch = AsyncMock(return_value="a2")
+        assert await cache.get_or_fetch("a", fetch, ttl=10, stale_ttl=20) == "a2"
+        assert len(cache) == 2
+
+
+class TestCachedDecorator:
+    """Test the cached method decorator."""
+
+    class Service:
+        def __init__(self, ttl):
+            self.config = SimpleNamespace(ttl_s=ttl)
+            self._cache = AsyncTTLCache()
+            self.calls = 0
+
+        @cached("ttl_s")
+        async def lookup(self, name, force_refresh=False):
+            self.calls += 1
+            return f"result {self.calls} for {name}"
+
+    async def test_results_cached_per_arguments(self, clock):
+        """Test repeated calls with the same arguments hit the cache."""
+        service = self.Service(ttl=60)
+
+        assert await service.lookup("a") == "result 1 for a"
+        assert await service.lookup("a") == "result 1 for a"
+        assert await service.lookup("b") == "result 2 for b"
+
+        assert service.calls == 2
+
+    async def test_zero_ttl_disables_cache(self, clock):
+        """Test a TTL of 0 bypasses the cache."""
+        service = self.Service(ttl=0)
+
+        await service.lookup("a")
+        await service.lookup("a")
+
+        assert service.calls == 2
+        assert len(service._cache) == 0
+
+    async def test_incomplete_results_not_cached(self, clock):
+        """Test results flagged with mark_incomplete are fetched again."""
+
+        class PartialService(self.Service):
+            @cached("ttl_s")
+            async def lookup(self, name, force_refresh=False):
+                self.calls += 1
+                if self.calls == 1:
+                    mark_incomplete()
+                return f"result {self.calls} for {name}"
+
+        service = PartialService(ttl=60)
+
+        assert await service.lookup("a") == "result 1 for a"
+        assert await service.lookup("a") == "result 2 for a"
+        assert await service.lookup("a") == "result 2 for a"
+        assert len(service._cache) == 1
+
+    async def test_force_refresh_replaces_cached_value(self, clock):
+        """Test force_refresh skips the lookup and stores the fresh result."""
+        service = self.Service(ttl=60)
+
+        assert await service.lookup("a") == "result 1 for a"
+        assert await service.lookup("a", force_refresh=True) == "result 2 for a"
+        assert await service.lookup("a") == "result 2 for a"
+
+
+class TestOpenDiskCache:
+    """Test opening the persistent cache."""
+
+    def test_disabled_without_directory(self):
+        """Test no cache is opened when no directory is configured."""
+        assert open_disk_cache(None) is None
+
+    def test_opens_cache_in_directory(self, tmp_path):
+        """Test a diskcache.Cache is opened in the configured directory."""
+        diskcache = pytest.importorskip("diskcache")
+
+        disk_cache = open_disk_cache(str(tmp_path))
+
+        assert isinstance(disk_cache, diskcache.Cache)
+        disk_cache.close()
+
+    def test_disabled_without_diskcache(self, tmp_path, monkeypatch):
+        """Test the cache is skipped when diskcache is not installed."""
+        monkeypatch.setattr("medium_mcp.cache.diskcache", None)
+
+        assert open_disk_cache(str(tmp_path)) is None
+
+    def test_disabled_when_directory_unusable(self, tmp_path):
+        """Test an unusable cache directory disables the cache."""
+        pytest.importorskip("diskcache")
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+
+        assert open_disk_cache(str(blocker / "cache")) is None
@@ -1,13 +1,32 @@
 """Tests for configuration management."""
 
-import os
-from unittest.mock import patch
+from unittest.mock import Mock
 
 import pytest
 from pydantic import ValidationError
 
 from medium_mcp.config import MediumMCPConfig
 
+# Environment variables read by MediumMCPConfig.from_env
+CONFIG_ENV_VARS = (
+    "RAPIDAPI_KEY",
+    "MAX_ARTICLES_PER_REQUEST",
+    "LOG_LEVEL",
+    "USER_CACHE_TTL",
+    "TOPFEEDS_CACHE_TTL",
+    "CONTENT_CACHE_TTL",
+    "CACHE_DIR",
+)
+
+
+@pytest.fixture
+def config_env(monkeypatch):
+    """Clear the config environment variables and skip loading .env files."""
+    for name in CONFIG_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setattr("medium_mcp.config._env_loaded", True)
+    return monkeypatch
+
 
 class TestMediumMCPConfig:
     """Test configuration management."""
@@ -27,6 +46,15 @@ class TestMediumMCPConfig:
         config = MediumMCPConfig(rapidapi_key="test_key_123456789")
 
         assert config.max_articles_per_request == 3
+        assert config.user_ttl_s == 21600
+        assert config.topfeeds_ttl_s == 300
+        assert config.content_ttl_s == 86400
+        assert config.cache_dir is None
+
+    def test_cache_ttl_validation(self):
+        """Test cache TTLs cannot be negative."""
+        with pytest.raises(ValidationError):
+            MediumMCPConfig(rapidapi_key="test_key_123456789", user_ttl_s=-1)
 
     def test_invalid_rapidapi_key(self):
         """Test validation of RapidAPI key."""
@@ -53,31 +81,58 @@ class TestMediumMCPConfig:
                 rapidapi_key="test_key_123456789", max_articles_per_request=101
             )
 
-
-    @patch.dict(os.environ, {"RAPIDAPI_KEY": "test_key_from_env"})
-    def test_from_env_with_key(self):
+    @pytest.mark.parametrize(
+        "env, expected",
+        [
+            (
+                {"RAPIDAPI_KEY": "test_key_from_env"},
+                ("test_key_from_env", 3, 21600, 300, 86400, None),
+            ),
+            (
+                {
+                    "RAPIDAPI_KEY": "test_key_from_env",
+                    "MAX_ARTICLES_PER_REQUEST": "50",
+                    "USER_CACHE_TTL": "60",
+                    "TOPFEEDS_CACHE_TTL": "0",
+                    "CONTENT_CACHE_TTL": "3600",
+                    "CACHE_DIR": "/tmp/medium-mcp",
+                },
+                ("test_key_from_env", 50, 60, 0, 3600, "/tmp/medium-mcp"),
+            ),
+        ],
+        ids=["key_only", "all_values"],
+    )
+    def test_from_env(self, config_env, env, expected):
         """Test creating config from environment variables."""
+        for name, value in env.items():
+            config_env.setenv(name, value)
+
         config = MediumMCPConfig.from_env()
-        assert config.rapidapi_key == "test_key_from_env"
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_from_env_without_key(self):
+        assert (
+            config.rapidapi_key,
+            config.max_articles_per_request,
+            config.user_ttl_s,
+            config.topfeeds_ttl_s,
+            config.content_ttl_s,
+            config.cache_dir,
+        ) == expected
+
+    def test_from_env_without_key(self, config_env):
         """Test error when RAPIDAPI_KEY is missing."""
         with pytest.raises(
             ValueError, match="RAPIDAPI_KEY environment variable is required"
         ):
             MediumMCPConfig.from_env()
 
-    @patch.dict(
-        os.environ,
-        {
-            "RAPIDAPI_KEY": "test_key_from_env",
-            "MAX_ARTICLES_PER_REQUEST": "50",
-        },
-    )
-    def test_from_env_with_all_values(self):
-        """Test creating config from all environment variables."""
-        config = MediumMCPConfig.from_env()
+    def test_from_env_loads_dotenv_once(self, config_env):
+        """Test the .env file is only read on the first from_env call."""
+        config_env.setenv("RAPIDAPI_KEY", "test_key_from_env")
+        config_env.setattr("medium_mcp.config._env_loaded", False)
+        mock_load_dotenv = Mock()
+        config_env.setattr("dotenv.load_dotenv", mock_load_dotenv)
 
-        assert config.rapidapi_key == "test_key_from_env"
-        assert config.max_articles_per_request == 50
+        MediumMCPConfig.from_env()
+        MediumMCPConfig.from_env()
+
+        mock_load_dotenv.assert_called_once_with()
@@ -1,95 +1,125 @@
 """Tests for formatting functions."""
 
 import pytest
-from datetime import datetime
-
-from medium_mcp.formatting import normalize_tag, convert_to_string
+from datetime import date, datetime
+
+from medium_mcp.formatting import convert_api_date, normalize_tag, convert_to_string
+
+
+# (tag, expected) pairs for normalize_tag
+NORMALIZE_TAG_CASES = (
+    # Spaces become hyphens
+    ("data science", "data-science"),
+    ("machine learning", "machine-learning"),
+    ("artificial intelligence", "artificial-intelligence"),
+    # Uppercase and mixed case are lowered
+    ("DATA SCIENCE", "data-science"),
+    ("AI", "ai"),
+    ("Machine Learning", "machine-learning"),
+    ("LLM", "llm"),
+    ("Data Science", "data-science"),
+    ("PyTorch Tutorial", "pytorch-tutorial"),
+    ("JavaScript Tips", "javascript-tips"),
+    # Every space is replaced, including repeated ones
+    ("deep  learning", "deep--learning"),
+    ("natural   language   processing", "natural---language---processing"),
+    # Already normalized and single word tags
+    ("data-science", "data-science"),
+    ("ai", "ai"),
+    ("machine-learning", "machine-learning"),
+    ("python", "python"),
+    ("PYTHON", "python"),
+    ("JavaScript", "javascript"),
+    # Empty and None pass through
+    ("", ""),
+    (None, None),
+    # Numbers and special characters are kept
+    ("Python 3.11", "python-3.11"),
+    ("Web 2.0", "web-2.0"),
+    ("C++ Programming", "c++-programming"),
+    # Leading and trailing spaces are not stripped
+    ("  data science  ", "--data-science--"),
+    (" python ", "-python-"),
+)
 
 
 class TestNormalizeTag:
     """Test normalize_tag function."""
 
-    def test_basic_tag_normalization(self):
-        """Test basic tag normalization with spaces."""
-        assert normalize_tag("data science") == "data-science"
-        assert normalize_tag("machine learning") == "machine-learning"
-        assert normalize_tag("artificial intelligence") == "artificial-intelligence"
-
-    def test_uppercase_normalization(self):
-        """Test normalization of uppercase tags."""
-        assert normalize_tag("DATA SCIENCE") == "data-science"
-        assert normalize_tag("AI") == "ai"
-        assert normalize_tag("Machine Learning") == "machine-learning"
-        assert normalize_tag("LLM") == "llm"
-
-    def test_mixed_case_normalization(self):
-        """Test normalization of mixed case tags."""
-        assert normalize_tag("Data Science") == "data-science"
-        assert normalize_tag("PyTorch Tutorial") == "pytorch-tutorial"
-        assert normalize_tag("JavaScript Tips") == "javascript-tips"
-
-    def test_multiple_spaces(self):
-        """Test normalization with multiple spaces."""
-        assert normalize_tag("deep  learning") == "deep--learning"
-        assert normalize_tag("natural   language   processing") == "natural---language---processing"
-
-    def test_already_normalized_tags(self):
-        """Test tags that are already in correct format."""
-        assert normalize_tag("data-science") == "data-science"
-        assert normalize_tag("ai") == "ai"
-        assert normalize_tag("machine-learning") == "machine-learning"
-
-    def test_single_word_tags(self):
-        """Test single word tags."""
-        assert normalize_tag("python") == "python"
-        assert normalize_tag("PYTHON") == "python"
-        assert normalize_tag("JavaScript") == "javascript"
-
-    def test_empty_and_none_tags(self):
-        """Test empty and None tag handling."""
-        assert normalize_tag("") == ""
-        assert normalize_tag(None) == None
-
-    def test_tags_with_special_characters(self):
-        """Test tags with numbers and other characters."""
-        assert normalize_tag("Python 3.11") == "python-3.11"
-        assert normalize_tag("Web 2.0") == "web-2.0"
-        assert normalize_tag("C++ Programming") == "c++-programming"
-
-    def test_leading_trailing_spaces(self):
-        """Test tags with leading/trailing spaces."""
-        assert normalize_tag("  data science  ") == "--data-science--"
-        assert normalize_tag(" python ") == "-python-"
+    @pytest.mark.parametrize("tag, expected", NORMALIZE_TAG_CASES)
+    def test_normalize_tag(self, tag, expected):
+        """Test tags are lowered with spaces replaced by hyphens."""
+        assert normalize_tag(tag) == expected
+
+
+# Helper objects for convert_to_string
+class _MockUser:
+    __slots__ = ("username",)
+
+    def __init__(self, username):
+        self.username = username
+
+
+class _MockDate:
+    __slots__ = ()
+
+    def isoformat(self):
+        return "2024-01-15"
+
+
+class _ComplexObject:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return f"ComplexObject({self.value})"
+
+
+class _UserWithStr:
+    __slots__ = ("username",)
+
+    def __init__(self, username):
+        self.username = username
+
+    def __str__(self):
+        return "should not be used"
+
+
+class _DateWithStr:
+    __slots__ = ()
+
+    def isoformat(self):
+        return "2024-01-15T12:00:00"
+
+    def __str__(self):
+        return "should not be used"
 
 
 class TestConvertToString:
     """Test convert_to_string function."""
 
-    def test_none_values(self):
-        """Test conversion of None values."""
-        assert convert_to_string(None) == ""
-        
-    def test_empty_string(self):
-        """Test conversion of empty string."""
-        assert convert_to_string("") == ""
-
-    def test_regular_strings(self):
-        """Test conversion of regular strings."""
-        assert convert_to_string("hello") == "hello"
-        assert convert_to_string("test string") == "test string"
-
-    def test_numbers(self):
-        """Test conversion of numbers."""
-        assert convert_to_string(42) == "42"
-        assert convert_to_string(3.14) == "3.14"
-        # 0 is falsy, so it returns empty string
-        assert convert_to_string(0) == ""
-
-    def test_boolean_values(self):
-        """Test conversion of boolean values."""
-        assert convert_to_string(True) == "True"
-        # False is falsy, so it returns empty string
-        assert convert_to_string(False) == ""
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, ""),
+            ("", ""),
+            ("hello", "hello"),
+            ("test string", "test string"),
+            (42, "42"),
+            (3.14, "3.14"),
+            # Falsy values other than strings become empty strings
+            (0, ""),
+            (True, "True"),
+            (False, ""),
+            ([1, 2, 3], "[1, 2, 3]"),
+            ({"key": "value"}, "{'key': 'value'}"),
+        ],
+    )
+    def test_primitive_values(self, value, expected):
+        """Test conversion of None, strings, numbers, booleans and containers."""
+        assert convert_to_string(value) == expected
 
     def test_datetime_objects(self):
         """Test conversion of datetime objects."""
@@ -97,72 +127,64 @@ class TestConvertToString:
         result = convert_to_string(dt)
         assert result == "2024-01-15T10:30:45"
 
+    def test_date_objects(self):
+        """Test conversion of date objects."""
+        assert convert_to_string(date(2024, 1, 15)) == "2024-01-15"
+
     def test_objects_with_username(self):
         """Test conversion of objects with username attribute."""
-        class MockUser:
-            def __init__(self, username):
-                self.username = username
-
-        user = MockUser("testuser")
+        user = _MockUser("testuser")
         assert convert_to_string(user) == "testuser"
 
         # Test with None username - falls back to str() since username is falsy
-        user_none = MockUser(None)
+        user_none = _MockUser(None)
         # This will use str() of the object since username is None (falsy)
         result = convert_to_string(user_none)
         assert "MockUser object" in result
 
         # Test with empty username - also falls back to str() since empty string is falsy
-        user_empty = MockUser("")
+        user_empty = _MockUser("")
         result = convert_to_string(user_empty)
         assert "MockUser object" in result
 
     def test_objects_with_isoformat(self):
         """Test conversion of objects with isoformat method."""
-        class MockDate:
-            def isoformat(self):
-                return "2024-01-15"
-
-        date_obj = MockDate()
+        date_obj = _MockDate()
         assert convert_to_string(date_obj) == "2024-01-15"
 
     def test_complex_objects(self):
         """Test conversion of complex objects."""
-        class ComplexObject:
-            def __init__(self, value):
-                self.value = value
-            
-            def __str__(self):
-                return f"ComplexObject({self.value})"
-
-        obj = ComplexObject("test")
+        obj = _ComplexObject("test")
         assert convert_to_string(obj) == "ComplexObject(test)"
 
-    def test_list_and_dict(self):
-        """Test conversion of lists and dictionaries."""
-        assert convert_to_string([1, 2, 3]) == "[1, 2, 3]"
-        assert convert_to_string({"key": "value"}) == "{'key': 'value'}"
-
     def test_priority_username_over_str(self):
         """Test that username attribute takes priority over __str__."""
-        class UserWithStr:
-            def __init__(self, username):
-                self.username = username
-            
-            def __str__(self):
-                return "should not be used"
-
-        user = UserWithStr("priorityuser")
+        user = _UserWithStr("priorityuser")
         assert convert_to_string(user) == "priorityuser"
 
     def test_priority_isoformat_over_str(self):
         """Test that isoformat method takes priority over __str__."""
-        class DateWithStr:
-            def isoformat(self):
-                return "2024-01-15T12:00:00"
-            
-            def __str__(self):
-                return "should not be used"
-
-        date_obj = DateWithStr()
-        assert convert_to_string(date_obj) == "2024-01-15T12:00:00"
\ No newline at end of file
+        date_obj = _DateWithStr()
+        assert convert_to_string(date_obj) == "2024-01-15T12:00:00"
+
+
+class TestConvertApiDate:
+    """Test convert_api_date function."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            # API timestamps become ISO-8601 strings
+            ("2024-01-15 10:30:45", "2024-01-15T10:30:45"),
+            # Other strings are returned unchanged
+            ("2024-01-15", "2024-01-15"),
+            ("not a date", "not a date"),
+            ("", ""),
+            # Non-strings fall back to convert_to_string
+            (None, ""),
+            (datetime(2024, 1, 15, 10, 30), "2024-01-15T10:30:00"),
+        ],
+    )
+    def test_convert_api_date(self, value, expected):
+        """Test API dates are converted with a raw-value fallback."""
+        assert convert_api_date(value) == expected
@@ -1,305 +1,374 @@
 """Tests for MCP server functions."""
 
-import json
-import os
-from unittest.mock import Mock, patch
+import subprocess
+import sys
+
+import orjson
 import pytest
 
-from medium_mcp.models import MediumError, MediumUser, MediumArticle, ArticleContent
+from medium_mcp.models import MediumError
 from medium_mcp.server import (
     get_user_info,
     get_user_articles, 
     get_article_content,
     get_top_feeds,
     search_articles,
+    get_user_profile_with_articles,
+    get_articles_bulk,
     VALID_FEED_MODES
 )
 
-
-@pytest.fixture
-def mock_user():
-    """Mock MediumUser for testing."""
-    return MediumUser(
-        user_id="123456",
-        username="testuser",
-        fullname="Test User",
-        followers_count=1000,
-        following_count=500,
-    )
-
-
-@pytest.fixture
-def mock_article():
-    """Mock MediumArticle for testing.""" 
-    return MediumArticle(
-        article_id="abc123",
-        title="Test Article",
-        author="testuser",
-        published_at="2024-01-01",
-        last_modified_at="2024-01-02",
-        url="https://medium.com/@testuser/test-article",
-        unique_slug="test-article",
-    )
-
-
-@pytest.fixture
-def mock_article_content():
-    """Mock ArticleContent for testing."""
-    return ArticleContent(
-        title="Test Article",
-        content="This is test content",
-        content_format="text",
-        author="testuser", 
-        published_at="2024-01-01",
-    )
-
-
-@pytest.fixture
-def setup_env():
-    """Setup test environment variables."""
-    os.environ['RAPIDAPI_KEY'] = 'test_api_key_123456789012345'
-    yield
-    # Cleanup
-    if 'RAPIDAPI_KEY' in os.environ:
-        del os.environ['RAPIDAPI_KEY']
-
-
+pytestmark = pytest.mark.anyio
+
+# VALID_FEED_MODES must match the FeedMode Literal the tools accept
+assert set(VALID_FEED_MODES) == {
+    "hot", "new", "top_year", "top_month", "top_week", "top_all_time"
+}
+
+loads = orjson.loads
+
+# Tool output for the shared mock_user, mock_article and mock_article_content
+EXPECTED_USER = {
+    "user_id": "123456",
+    "username": "testuser",
+    "fullname": "Test User",
+    "bio": None,
+    "followers_count": 1000,
+    "following_count": 500,
+    "twitter_username": None,
+    "image_url": None,
+    "medium_member_at": None,
+    "is_writer_program_enrolled": False,
+    "has_list": False,
+    "is_suspended": False,
+}
+
+EXPECTED_ARTICLE = {
+    "article_id": "abc123",
+    "title": "Test Article",
+    "subtitle": None,
+    "author": "testuser",
+    "published_at": "2024-01-01",
+    "last_modified_at": "2024-01-02",
+    "tags": [],
+    "topics": [],
+    "claps": 0,
+    "voters": 0,
+    "word_count": 0,
+    "reading_time": 0.0,
+    "responses_count": 0,
+    "url": "https://medium.com/@testuser/test-article",
+    "unique_slug": "test-article",
+    "is_locked": False,
+    "is_shortform": False,
+    "language": "en",
+}
+
+EXPECTED_CONTENT = {
+    "title": "Test Article",
+    "subtitle": None,
+    "content": "This is test content",
+    "content_format": "text",
+    "author": "testuser",
+    "published_at": "2024-01-01",
+}
+
+# Counts outside the 1-100 range accepted by every tool with a count
+INVALID_COUNTS = [0, 101, -1]
+
+# Each tool taking a count, with the arguments that precede it
+TOOLS_WITH_COUNT = [
+    pytest.param(get_user_articles, ("testuser",), id="get_user_articles"),
+    pytest.param(get_top_feeds, ("programming", "hot"), id="get_top_feeds"),
+    pytest.param(search_articles, ("python",), id="search_articles"),
+    pytest.param(
+        get_user_profile_with_articles,
+        ("testuser",),
+        id="get_user_profile_with_articles",
+    ),
+]
+
+
+@pytest.mark.unit
 class TestGetUserInfo:
     """Test get_user_info MCP tool."""
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_get_user_info_success(self, mock_ensure_client, mock_user, setup_env):
+    async def test_get_user_info_success(self, mock_client, mock_user):
         """Test successful user info retrieval."""
-        mock_client = Mock()
         mock_client.get_user_info.return_value = mock_user
-        mock_ensure_client.return_value = mock_client
 
-        result = get_user_info("testuser")
-        
-        # Parse JSON result
-        data = json.loads(result)
-        
-        assert data['username'] == 'testuser'
-        assert data['fullname'] == 'Test User'
-        assert data['followers_count'] == 1000
+        result = await get_user_info("testuser")
+
+        assert "\n" not in result  # compact output
+        assert loads(result) == EXPECTED_USER
         mock_client.get_user_info.assert_called_once_with("testuser")
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_get_user_info_not_found(self, mock_ensure_client, setup_env):
+    async def test_get_user_info_not_found(self, mock_client):
         """Test user not found scenario."""
-        mock_client = Mock()
         mock_client.get_user_info.return_value = None
-        mock_ensure_client.return_value = mock_client
 
-        result = get_user_info("nonexistent_user")
+        result = await get_user_info("nonexistent_user")
         
-        data = json.loads(result)
+        data = loads(result)
         assert data is None
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_get_user_info_medium_error(self, mock_ensure_client, setup_env):
+    async def test_get_user_info_medium_error(self, mock_client):
         """Test Medium API error handling."""
-        mock_client = Mock()
         mock_client.get_user_info.side_effect = MediumError("User not found", status_code=404)
-        mock_ensure_client.return_value = mock_client
 
         with pytest.raises(Exception, match="Medium API Error: User not found"):
-            get_user_info("testuser")
+            await get_user_info("testuser")
 
 
+@pytest.mark.unit
 class TestGetUserArticles:
     """Test get_user_articles MCP tool."""
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_get_user_articles_success(self, mock_ensure_client, mock_article, setup_env):
+    async def test_get_user_articles_success(self, mock_client, mock_article):
         """Test successful user articles retrieval."""
-        mock_client = Mock()
         mock_client.get_user_articles.return_value = [mock_article]
-        mock_ensure_client.return_value = mock_client
 
-        result = get_user_articles("testuser", 3)
-        
-        data = json.loads(result)
-        
-        assert len(data) == 1
-        assert data[0]['title'] == 'Test Article'
-        assert data[0]['author'] == 'testuser'
-        mock_client.get_user_articles.assert_called_once_with("testuser", 3)
+        result = await get_user_articles("testuser", 3)
 
-    def test_get_user_articles_invalid_count(self, setup_env):
-        """Test invalid count parameter validation."""
-        with pytest.raises(Exception, match="Count must be between 1 and 100"):
-            get_user_articles("testuser", 0)
-        
-        with pytest.raises(Exception, match="Count must be between 1 and 100"):
-            get_user_articles("testuser", 101)
+        assert loads(result) == [EXPECTED_ARTICLE]
+        mock_client.get_user_articles.assert_called_once_with("testuser", 3)
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_get_user_articles_empty_result(self, mock_ensure_client, setup_env):
+    async def test_get_user_articles_empty_result(self, mock_client):
         """Test empty articles result."""
-        mock_client = Mock()
         mock_client.get_user_articles.return_value = []
-        mock_ensure_client.return_value = mock_client
 
-        result = get_user_articles("testuser", 5)
+        result = await get_user_articles("testuser", 5)
         
-        data = json.loads(result)
+        data = loads(result)
         assert data == []
 
 
+@pytest.mark.unit
 class TestGetArticleContent:
     """Test get_article_content MCP tool."""
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_get_article_content_success(self, mock_ensure_client, mock_article_content, setup_env):
+    async def test_get_article_content_success(self, mock_client, mock_article_content):
         """Test successful article content retrieval."""
-        mock_client = Mock()
         mock_client.get_article_content.return_value = mock_article_content
-        mock_ensure_client.return_value = mock_client
 
-        result = get_article_content("abc123", "text")
-        
-        data = json.loads(result)
-        
-        assert data['title'] == 'Test Article'
-        assert data['content'] == 'This is test content'
-        assert data['content_format'] == 'text'
-        mock_client.get_article_content.assert_called_once_with("abc123", "text")
+        result = await get_article_content("abc123", "text")
+
+        assert loads(result) == EXPECTED_CONTENT
+        mock_client.get_article_content.assert_called_once_with(
+            "abc123", "text", force_refresh=False
+        )
+
+    async def test_get_article_content_force_refresh(self, mock_client, mock_article_content):
+        """Test force_refresh is passed through to the client."""
+        mock_client.get_article_content.return_value = mock_article_content
 
-    def test_get_article_content_invalid_format(self, setup_env):
+        await get_article_content("abc123", "text", force_refresh=True)
+
+        mock_client.get_article_content.assert_called_once_with(
+            "abc123", "text", force_refresh=True
+        )
+
+    async def test_get_article_content_invalid_format(self):
         """Test invalid format parameter validation."""
         with pytest.raises(Exception, match="Format must be 'text', 'html', or 'markdown'"):
-            get_article_content("abc123", "invalid")
+            await get_article_content("abc123", "invalid")
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_get_article_content_default_format(self, mock_ensure_client, mock_article_content, setup_env):
+    async def test_get_article_content_default_format(self, mock_client, mock_article_content):
         """Test default format parameter."""
-        mock_client = Mock()
         mock_client.get_article_content.return_value = mock_article_content
-        mock_ensure_client.return_value = mock_client
 
-        result = get_article_content("abc123")  # No format specified
+        result = await get_article_content("abc123")  # No format specified
         
-        data = json.loads(result)
+        data = loads(result)
         assert data['content_format'] == 'text'
-        mock_client.get_article_content.assert_called_once_with("abc123", "text")
+        mock_client.get_article_content.assert_called_once_with(
+            "abc123", "text", force_refresh=False
+        )
 
 
+@pytest.mark.unit
 class TestGetTopFeeds:
     """Test get_top_feeds MCP tool."""
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_get_top_feeds_success(self, mock_ensure_client, mock_article, setup_env):
+    async def test_get_top_feeds_success(self, mock_client, mock_article):
         """Test successful top feeds retrieval."""
-        mock_client = Mock()
         mock_client.get_top_feeds.return_value = [mock_article]
-        mock_ensure_client.return_value = mock_client
 
-        result = get_top_feeds("programming", "hot", 5)
-        
-        data = json.loads(result)
-        
-        assert len(data) == 1
-        assert data[0]['title'] == 'Test Article'
+        result = await get_top_feeds("programming", "hot", 5)
+
+        assert loads(result) == [EXPECTED_ARTICLE]
         mock_client.get_top_feeds.assert_called_once_with("programming", "hot", 5)
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_get_top_feeds_default_params(self, mock_ensure_client, mock_article, setup_env):
+    async def test_get_top_feeds_default_params(self, mock_client, mock_article):
         """Test get_top_feeds with default parameters."""
-        mock_client = Mock()
         mock_client.get_top_feeds.return_value = [mock_article]
-        mock_ensure_client.return_value = mock_client
 
-        result = get_top_feeds()  # All defaults
+        result = await get_top_feeds()  # All defaults
         
-        data = json.loads(result)
+        data = loads(result)
         assert len(data) == 1
         mock_client.get_top_feeds.assert_called_once_with("", "top_month", 3)
 
-    def test_get_top_feeds_invalid_mode(self, setup_env):
+    async def test_get_top_feeds_invalid_mode(self):
         """Test invalid mode parameter validation."""
         with pytest.raises(Exception, match="Invalid mode 'invalid_mode'"):
-            get_top_feeds("programming", "invalid_mode", 5)
+            await get_top_feeds("programming", "invalid_mode", 5)
 
-    def test_get_top_feeds_valid_modes(self, setup_env):
-        """Test that all valid modes are accepted."""
-        # This test ensures VALID_FEED_MODES matches FeedMode Literal
-        expected_modes = ["hot", "new", "top_year", "top_month", "top_week", "top_all_time"]
-        assert VALID_FEED_MODES == expected_modes
+    @pytest.mark.parametrize("mode", VALID_FEED_MODES)
+    async def test_get_top_feeds_all_modes(self, mock_client, mode):
+        """Test every valid mode is accepted and forwarded to the client."""
+        mock_client.get_top_feeds.return_value = []
 
-    def test_get_top_feeds_invalid_count(self, setup_env):
-        """Test invalid count parameter validation."""
-        with pytest.raises(Exception, match="Count must be between 1 and 100"):
-            get_top_feeds("programming", "hot", 0)
-        
-        with pytest.raises(Exception, match="Count must be between 1 and 100"):
-            get_top_feeds("programming", "hot", 101)
+        await get_top_feeds("programming", mode, 1)
 
+        mock_client.get_top_feeds.assert_called_once_with("programming", mode, 1)
 
+
+@pytest.mark.unit
 class TestSearchArticles:
     """Test search_articles MCP tool."""
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_search_articles_success(self, mock_ensure_client, mock_article, setup_env):
+    async def test_search_articles_success(self, mock_client, mock_article):
         """Test successful article search."""
-        mock_client = Mock()
         mock_client.search_articles.return_value = [mock_article]
-        mock_ensure_client.return_value = mock_client
 
-        result = search_articles("python programming", 5)
-        
-        data = json.loads(result)
-        
-        assert len(data) == 1
-        assert data[0]['title'] == 'Test Article'
-        mock_client.search_articles.assert_called_once_with("python programming", 5)
-
-    def test_search_articles_empty_query(self, setup_env):
-        """Test empty query validation."""
-        with pytest.raises(Exception, match="Search query cannot be empty"):
-            search_articles("", 5)
-        
-        with pytest.raises(Exception, match="Search query cannot be empty"):
-            search_articles("   ", 5)
+        result = await search_articles("python programming", 5)
 
-    def test_search_articles_invalid_count(self, setup_env):
-        """Test invalid count parameter validation."""
-        with pytest.raises(Exception, match="Count must be between 1 and 100"):
-            search_articles("python", 0)
-        
-        with pytest.raises(Exception, match="Count must be between 1 and 100"):
-            search_articles("python", 101)
+        assert loads(result) == [EXPECTED_ARTICLE]
+        mock_client.search_articles.assert_called_once_with("python programming", 5)
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_search_articles_no_results(self, mock_ensure_client, setup_env):
+    async def test_search_articles_no_results(self, mock_client):
         """Test search with no results."""
-        mock_client = Mock()
         mock_client.search_articles.return_value = []
-        mock_ensure_client.return_value = mock_client
 
-        result = search_articles("very_rare_query", 3)
+        result = await search_articles("very_rare_query", 3)
         
-        data = json.loads(result)
+        data = loads(result)
         assert data == []
 
 
+@pytest.mark.unit
+class TestArgumentValidation:
+    """Test argument validation shared by several tools."""
+
+    @pytest.mark.parametrize("count", INVALID_COUNTS)
+    @pytest.mark.parametrize("tool, base_args", TOOLS_WITH_COUNT)
+    async def test_invalid_count(self, tool, base_args, count):
+        """Test counts outside 1-100 are rejected."""
+        with pytest.raises(Exception, match="Count must be between 1 and 100"):
+            await tool(*base_args, count)
+
+    @pytest.mark.parametrize("query", ["", "   "])
+    async def test_search_articles_empty_query(self, query):
+        """Test empty and blank queries are rejected."""
+        with pytest.raises(Exception, match="Search query cannot be empty"):
+            await search_articles(query, 5)
+
+
+@pytest.mark.unit
+class TestGetUserProfileWithArticles:
+    """Test get_user_profile_with_articles MCP tool."""
+
+    async def test_get_user_profile_with_articles_success(self, mock_client, mock_user, mock_article):
+        """Test user info and articles are returned together."""
+        mock_client.get_user_info.return_value = mock_user
+        mock_client.get_user_articles.return_value = [mock_article]
+
+        result = await get_user_profile_with_articles("testuser", 3)
+
+        assert loads(result) == {"user": EXPECTED_USER, "articles": [EXPECTED_ARTICLE]}
+        mock_client.get_user_info.assert_called_once_with("testuser")
+        mock_client.get_user_articles.assert_called_once_with("testuser", 3)
+
+    async def test_get_user_profile_with_articles_not_found(self, mock_client):
+        """Test missing user and articles are returned as null and empty."""
+        mock_client.get_user_info.return_value = None
+        mock_client.get_user_articles.return_value = None
+
+        result = await get_user_profile_with_articles("nonexistent_user")
+
+        assert loads(result) == {'user': None, 'articles': []}
+
+
+@pytest.mark.unit
+class TestGetArticlesBulk:
+    """Test get_articles_bulk MCP tool."""
+
+    async def test_get_articles_bulk_success(self, mock_client, mock_article_content):
+        """Test contents are returned keyed by article ID."""
+        mock_client.get_article_content.return_value = mock_article_content
+
+        result = await get_articles_bulk(["abc123", "def456", "abc123"], "text")
+
+        data = loads(result)
+
+        assert data == {"abc123": EXPECTED_CONTENT, "def456": EXPECTED_CONTENT}
+        assert list(data) == ['abc123', 'def456']
+        assert mock_client.get_article_content.await_count == 2
+
+    async def test_get_articles_bulk_partial_failure(self, mock_client, mock_article_content):
+        """Test articles that fail to load are returned as null."""
+        mock_client.get_article_content.side_effect = [
+            mock_article_content,
+            MediumError("Resource not found", status_code=404),
+        ]
+
+        result = await get_articles_bulk(["abc123", "missing"])
+
+        assert loads(result) == {"abc123": EXPECTED_CONTENT, "missing": None}
+
+    async def test_get_articles_bulk_all_failed(self, mock_client):
+        """Test the error is raised when no article could be fetched."""
+        mock_client.get_article_content.side_effect = MediumError("Resource not found")
+
+        with pytest.raises(Exception, match="Medium API Error: Resource not found"):
+            await get_articles_bulk(["missing"])
+
+    async def test_get_articles_bulk_invalid_arguments(self):
+        """Test article ID count and format validation."""
+        with pytest.raises(Exception, match="between 1 and 100"):
+            await get_articles_bulk([])
+
+        with pytest.raises(Exception, match="Format must be 'text', 'html', or 'markdown'"):
+            await get_articles_bulk(["abc123"], "invalid")
+
+
+@pytest.mark.integration
 class TestErrorHandling:
     """Test error handling across server functions."""
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_client_not_initialized(self, mock_ensure_client):
+    async def test_client_not_initialized(self, monkeypatch):
         """Test behavior when client is not initialized."""
-        mock_ensure_client.side_effect = MediumError("Client not initialized")
-        
-        with pytest.raises(Exception, match="Medium API Error: Client not initialized"):
-            get_user_info("testuser")
+        monkeypatch.setattr("medium_mcp.server.client", None)
+
+        with pytest.raises(
+            Exception, match="Medium API Error: Medium MCP server not initialized"
+        ):
+            await get_user_info("testuser")
 
-    @patch('medium_mcp.server.ensure_client')
-    def test_unexpected_error_handling(self, mock_ensure_client, setup_env):
+    async def test_unexpected_error_handling(self, mock_client):
         """Test unexpected error handling."""
-        mock_client = Mock()
         mock_client.get_user_info.side_effect = RuntimeError("Unexpected error")
-        mock_ensure_client.return_value = mock_client
 
         with pytest.raises(Exception, match="Error: Unexpected error"):
-            get_user_info("testuser")
\ No newline at end of file
+            await get_user_info("testuser")
+
+
+@pytest.mark.integration
+class TestPackageExports:
+    """Test the package-level server export."""
+
+    def test_mcp_exported_from_package(self):
+        """Test medium_mcp.mcp resolves to the server instance."""
+        import medium_mcp
+        from medium_mcp.server import mcp
+
+        assert medium_mcp.mcp is mcp
+
+    def test_submodule_import_does_not_load_server(self):
+        """Test importing the client leaves the server unimported."""
+        code = (
+            "import sys, medium_mcp.client; "
+            "assert 'medium_mcp.server' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,10 +1,12 @@
 """Tests for type definitions."""
 
+import json
+
 import pytest
+from pydantic import ValidationError
 
 from medium_mcp.models import (
     ArticleContent,
-    MediumArticle,
     MediumComment,
     MediumError,
     MediumUser,
@@ -52,33 +54,18 @@ class TestMediumUser:
 class TestMediumArticle:
     """Test MediumArticle type."""
 
-    def test_valid_article_creation(self):
+    def test_valid_article_creation(self, article_factory):
         """Test creating a valid article."""
-        article = MediumArticle(
-            article_id="abc123",
-            title="Test Article",
-            author="testuser",
-            published_at="2024-01-01",
-            last_modified_at="2024-01-02",
-            url="https://medium.com/@testuser/test-article",
-            unique_slug="test-article",
-        )
+        article = article_factory()
 
         assert article.article_id == "abc123"
         assert article.title == "Test Article"
         assert article.author == "testuser"
         assert article.url == "https://medium.com/@testuser/test-article"
 
-    def test_article_with_metrics(self):
+    def test_article_with_metrics(self, article_factory):
         """Test article with engagement metrics."""
-        article = MediumArticle(
-            article_id="abc123",
-            title="Test Article",
-            author="testuser",
-            published_at="2024-01-01",
-            last_modified_at="2024-01-02",
-            url="https://medium.com/@testuser/test-article",
-            unique_slug="test-article",
+        article = article_factory(
             claps=250,
             voters=45,
             word_count=1500,
@@ -92,6 +79,24 @@ class TestMediumArticle:
         assert article.reading_time == 6.5
         assert article.responses_count == 12
 
+    def test_article_is_frozen(self, mock_article):
+        """Test articles cannot be modified after construction."""
+        with pytest.raises(ValidationError):
+            mock_article.title = "Changed"
+
+    def test_json_bytes_cached(self, mock_article):
+        """Test the JSON encoding is computed once and matches model_dump."""
+        assert json.loads(mock_article.json_bytes) == mock_article.model_dump()
+        assert mock_article.json_bytes is mock_article.json_bytes
+
+    def test_model_copy_refreshes_json_bytes(self, mock_article):
+        """Test copies with updates do not reuse the original encoding."""
+        mock_article.json_bytes
+
+        copied = mock_article.model_copy(update={"title": "Other"})
+
+        assert json.loads(copied.json_bytes)["title"] == "Other"
+
 
 
 class TestArticleContent:
@@ -151,23 +156,21 @@ class TestSearchResult:
         assert result.articles == []
         assert result.users == []
 
-    def test_search_result_with_articles(self):
+    def test_search_result_with_articles(self, article_factory):
         """Test search result with articles."""
-        article = MediumArticle(
-            article_id="abc123",
-            title="Test Article",
-            author="testuser",
-            published_at="2024-01-01",
-            last_modified_at="2024-01-02",
-            url="https://medium.com/@testuser/test-article",
-            unique_slug="test-article",
-        )
+        article = article_factory()
 
         result = SearchResult(query="test query", total_results=1, articles=[article])
 
         assert len(result.articles) == 1
         assert result.articles[0].title == "Test Article"
 
+    def test_unknown_fields_ignored(self):
+        """Test unknown fields from raw API data are dropped."""
+        result = SearchResult(query="test query", total_results=0, next_cursor="abc")
+
+        assert "next_cursor" not in result.model_dump()
+
 
 class TestMediumComment:
     """Test MediumComment type."""
@@ -187,3 +190,15 @@ class TestMediumComment:
         assert comment.content == "Great article!"
         assert comment.claps == 5
         assert comment.created_at == "2024-01-01"
+
+    def test_comment_is_frozen(self):
+        """Test comments cannot be modified after construction."""
+        comment = MediumComment(
+            comment_id="comment123",
+            author="commenter",
+            content="Great article!",
+            created_at="2024-01-01",
+        )
+
+        with pytest.raises(ValidationError):
+            comment.claps = 10